@@ -2,6 +2,7 @@
 
 import time
 from fastapi import APIRouter
+from fastapi.concurrency import run_in_threadpool
 from app.models import (
     AnalyzeRequest,
     SummaryResponse,
@@ -34,7 +35,7 @@ def health() -> HealthResponse:
 
 
 @router.post("/analyze", response_model=SummaryResponse, tags=["insights"])
-def analyze(req: AnalyzeRequest) -> SummaryResponse:
+async def analyze(req: AnalyzeRequest) -> SummaryResponse:
     """
     Analyze transactions and generate spending summary.
 
@@ -44,12 +45,12 @@ def analyze(req: AnalyzeRequest) -> SummaryResponse:
     Returns:
         Summary with total debit/credit, biggest category, top 5 categories
     """
-    result = service.summarize(req.transactions)
+    result = await run_in_threadpool(service.summarize, req.transactions)
     return SummaryResponse(**result)
 
 
 @router.post("/categorize", response_model=CategorizeResponse, tags=["insights"])
-def categorize(req: AnalyzeRequest) -> CategorizeResponse:
+async def categorize(req: AnalyzeRequest) -> CategorizeResponse:
     """
     Guess categories for transactions using keyword matching.
 
@@ -59,12 +60,12 @@ def categorize(req: AnalyzeRequest) -> CategorizeResponse:
     Returns:
         List of category guesses with reasons (aligned by index)
     """
-    guesses = service.categorize(req.transactions)
+    guesses = await run_in_threadpool(service.categorize, req.transactions)
     return CategorizeResponse(categories=guesses)
 
 
 @router.post("/anomalies", response_model=AnomalyResponse, tags=["insights"])
-def anomalies(req: AnalyzeRequest) -> AnomalyResponse:
+async def anomalies(req: AnalyzeRequest) -> AnomalyResponse:
     """
     Detect anomalies in transactions using z-score analysis.
 
@@ -74,12 +75,12 @@ def anomalies(req: AnalyzeRequest) -> AnomalyResponse:
     Returns:
         List of anomaly detection results (aligned by index)
     """
-    results = service.anomalies(req.transactions)
+    results = await run_in_threadpool(service.anomalies, req.transactions)
     return AnomalyResponse(anomalies=results)
 
 
 @router.post("/forecast", response_model=ForecastResponse, tags=["insights"])
-def forecast(req: AnalyzeRequest) -> ForecastResponse:
+async def forecast(req: AnalyzeRequest) -> ForecastResponse:
     """
     Forecast next month spending by category using simple methods.
 
@@ -89,5 +90,5 @@ def forecast(req: AnalyzeRequest) -> ForecastResponse:
     Returns:
         List of forecasts per category with method used
     """
-    forecasts = service.forecast(req.transactions)
+    forecasts = await run_in_threadpool(service.forecast, req.transactions)
     return ForecastResponse(forecasts=forecasts)
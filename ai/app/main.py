@@ -6,7 +6,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.api import router
 from app.config import settings
@@ -68,6 +68,9 @@ def create_app() -> FastAPI:
         title=settings.API_TITLE,
         version=settings.API_VERSION,
         lifespan=lifespan,
+        # orjson renders large response bodies several times faster than
+        # the stdlib json encoder
+        default_response_class=ORJSONResponse,
     )
 
     # Configure Prometheus metrics first (before middleware)
@@ -1,8 +1,11 @@
 """Core analytics and insights service logic."""
 
-from collections import defaultdict
 from datetime import datetime
-import statistics
+import re
+
+import numpy as np
+import pandas as pd
+
 from app.models import Txn, CategoryGuess, TopCategory, ForecastItem, AnomalyItem
 
 
@@ -15,40 +18,98 @@ CATEGORY_KEYWORDS = {
     "Entertainment": ["movie", "netflix", "spotify", "game", "concert", "theater", "entertainment"],
 }
 
+# Precompiled single-pass matcher over all keywords: one scan per description
+# instead of one substring scan per (category, keyword) pair. Alternatives are
+# kept in category-priority order so at any position the matcher prefers the
+# keyword of the highest-priority category, matching the old loop's outcome.
+_CATEGORY_PRIORITY = {cat: i for i, cat in enumerate(CATEGORY_KEYWORDS)}
+_KEYWORD_CATEGORY = {kw: cat for cat, kws in CATEGORY_KEYWORDS.items() for kw in kws}
+_KEYWORD_RE = re.compile("|".join(re.escape(kw) for kw in _KEYWORD_CATEGORY))
+
+# One immutable CategoryGuess per outcome, built at import time; the hot loop
+# hands out shared instances instead of re-rendering the reason string and
+# re-validating a model per transaction
+_GUESS_BY_CATEGORY = {
+    cat: CategoryGuess(
+        guessCategory=cat,
+        reason=f"Matched keyword in description: {cat.lower()}",
+    )
+    for cat in CATEGORY_KEYWORDS
+}
+_UNCATEGORIZED_GUESS = CategoryGuess(
+    guessCategory="Uncategorized",
+    reason="No matching keywords found",
+)
+
+
+def _to_frame(transactions: list[Txn]) -> pd.DataFrame:
+    """Build the transactions DataFrame from typed column arrays.
+
+    Extracting each column separately lands amounts in a float64 ndarray
+    directly, skipping the per-row dict materialization and object-dtype
+    inference that pd.DataFrame(list_of_dicts) would do.
+    """
+    n = len(transactions)
+    return pd.DataFrame(
+        {
+            "date": np.array([t.date for t in transactions], dtype=object),
+            "amount": np.fromiter((t.amount for t in transactions), dtype=np.float64, count=n),
+            "category": np.array([t.category for t in transactions], dtype=object),
+            "direction": np.array([t.direction for t in transactions], dtype=object),
+        },
+        copy=False,
+    )
+
 
 def summarize(transactions: list[Txn]) -> dict:
     """
     Compute spending summary.
-    
+
     Returns:
         - totalDebit: sum of all DEBIT transactions
         - totalCredit: sum of all CREDIT transactions
         - biggestCategory: category with highest debit spending
         - topCategories: top 5 categories by debit spending
     """
-    total_debit = 0.0
-    total_credit = 0.0
-    category_debits = defaultdict(float)
-    
-    for txn in transactions:
-        if txn.direction == "DEBIT":
-            total_debit += txn.amount
-            if txn.category:
-                category_debits[txn.category] += txn.amount
-        elif txn.direction == "CREDIT":
-            total_credit += txn.amount
-    
+    if not transactions:
+        return {
+            "totalDebit": 0.0,
+            "totalCredit": 0.0,
+            "biggestCategory": None,
+            "topCategories": [],
+        }
+
+    return summarize_df(_to_frame(transactions))
+
+
+def summarize_df(df: pd.DataFrame) -> dict:
+    """Vectorized core of summarize(), operating on a pre-built frame."""
+    debit_mask = df["direction"].values == "DEBIT"
+    credit_mask = df["direction"].values == "CREDIT"
+    amounts = df["amount"].values
+
+    total_debit = float(amounts[debit_mask].sum())
+    total_credit = float(amounts[credit_mask].sum())
+
+    # Debit totals per category (missing/empty categories excluded)
+    has_category = df["category"].notna().values & (df["category"].values != "")
+    category_debits = (
+        df.loc[debit_mask & has_category]
+        .groupby("category", sort=False)["amount"]
+        .sum()
+    )
+
     # Find biggest category
     biggest_category = None
-    if category_debits:
-        biggest_category = max(category_debits.items(), key=lambda x: x[1])[0]
-    
+    if not category_debits.empty:
+        biggest_category = category_debits.idxmax()
+
     # Top 5 categories
-    top_categories = sorted(category_debits.items(), key=lambda x: x[1], reverse=True)[:5]
     top_categories_list = [
-        TopCategory(category=cat, total=total) for cat, total in top_categories
+        TopCategory(category=cat, total=float(total))
+        for cat, total in category_debits.nlargest(5).items()
     ]
-    
+
     return {
         "totalDebit": total_debit,
         "totalCredit": total_credit,
@@ -60,159 +121,165 @@ def summarize(transactions: list[Txn]) -> dict:
 def categorize(transactions: list[Txn]) -> list[CategoryGuess]:
     """
     Guess categories for transactions using simple keyword matching.
-    
+
     Returns list aligned by transaction index.
     """
     results = []
-    
+
     for txn in transactions:
         # Build search text from description
         search_text = ""
         if txn.description:
             search_text += txn.description.lower()
-        
-        # Match against keywords
+
+        # Single scan over the description; pick the highest-priority
+        # category among all matched keywords (same order as the old
+        # per-category loop)
         matched_category = None
-        for category, keywords in CATEGORY_KEYWORDS.items():
-            if any(keyword in search_text for keyword in keywords):
+        best_priority = len(_CATEGORY_PRIORITY)
+        for match in _KEYWORD_RE.finditer(search_text):
+            category = _KEYWORD_CATEGORY[match.group()]
+            priority = _CATEGORY_PRIORITY[category]
+            if priority < best_priority:
+                best_priority = priority
                 matched_category = category
-                break
-        
+                if priority == 0:
+                    break
+
         if matched_category:
-            results.append(
-                CategoryGuess(
-                    guessCategory=matched_category,
-                    reason=f"Matched keyword in description: {matched_category.lower()}"
-                )
-            )
+            results.append(_GUESS_BY_CATEGORY[matched_category])
         else:
-            results.append(
-                CategoryGuess(
-                    guessCategory="Uncategorized",
-                    reason="No matching keywords found"
-                )
-            )
-    
+            results.append(_UNCATEGORIZED_GUESS)
+
     return results
 
 
 def anomalies(transactions: list[Txn]) -> list[AnomalyItem]:
     """
     Detect anomalies using z-score within each category's debit amounts.
-    
+
     Flag transactions with |z-score| >= 2 as anomalies.
     """
-    # Group debit transactions by category
-    category_amounts = defaultdict(list)
-    
-    for txn in transactions:
-        if txn.direction == "DEBIT":
-            category_amounts[txn.category or "Uncategorized"].append(txn)
-    
-    results = []
-    
-    for txn in transactions:
-        if txn.direction != "DEBIT":
-            # Only analyze debits
-            results.append(
-                AnomalyItem(
-                    date=txn.date,
-                    amount=txn.amount,
-                    category=txn.category,
-                    score=0.0,
-                    isAnomaly=False
-                )
-            )
-            continue
-        
-        category = txn.category or "Uncategorized"
-        amounts_in_category = [t.amount for t in category_amounts[category]]
-        
-        # Need at least 3 transactions to compute meaningful z-score
-        if len(amounts_in_category) < 3:
-            results.append(
-                AnomalyItem(
-                    date=txn.date,
-                    amount=txn.amount,
-                    category=txn.category,
-                    score=0.0,
-                    isAnomaly=False
-                )
-            )
-            continue
-        
-        # Compute z-score
-        mean = statistics.mean(amounts_in_category)
-        stdev = statistics.stdev(amounts_in_category)
-        
-        if stdev == 0:
-            z_score = 0.0
-        else:
-            z_score = (txn.amount - mean) / stdev
-        
-        is_anomaly = abs(z_score) >= 2.0
-        
-        results.append(
-            AnomalyItem(
-                date=txn.date,
-                amount=txn.amount,
-                category=txn.category,
-                score=round(z_score, 2),
-                isAnomaly=is_anomaly
-            )
+    if not transactions:
+        return []
+
+    return anomalies_df(_to_frame(transactions))
+
+
+def anomalies_df(df: pd.DataFrame) -> list[AnomalyItem]:
+    """Vectorized core of anomalies(), operating on a pre-built frame."""
+    dates = df["date"].values
+    amounts = df["amount"].values
+    debit_mask = df["direction"].values == "DEBIT"
+
+    # Missing categories (None/NaN depending on the column's dtype) and empty
+    # strings both group under "Uncategorized"; the raw values keep None for
+    # the response payload
+    raw_categories = np.array(
+        [None if (c is None or c != c) else c for c in df["category"].values],
+        dtype=object,
+    )
+    categories = np.array([c or "Uncategorized" for c in raw_categories], dtype=object)
+
+    # Per-category mean/std/count over debit amounts, computed once via
+    # factorize + bincount; the gathers below broadcast the group stats
+    # back to every transaction without a label-based join
+    codes, _ = pd.factorize(categories)
+    debit_codes = codes[debit_mask]
+    debit_amounts = amounts[debit_mask]
+    num_cats = int(codes.max()) + 1
+
+    counts = np.bincount(debit_codes, minlength=num_cats)
+    sums = np.bincount(debit_codes, weights=debit_amounts, minlength=num_cats)
+    sumsqs = np.bincount(debit_codes, weights=debit_amounts * debit_amounts, minlength=num_cats)
+
+    means = sums / np.maximum(counts, 1)
+    # Sample variance (ddof=1), clipped at zero against FP cancellation
+    variances = np.maximum(sumsqs - counts * means * means, 0.0) / np.maximum(counts - 1, 1)
+    stds = np.sqrt(variances)
+
+    mean_arr = means[codes]
+    std_arr = stds[codes]
+    count_arr = counts[codes]
+
+    # Z-scores in one vectorized pass; only debits in categories with at
+    # least 3 transactions and non-zero spread get a meaningful score
+    safe_std = np.where(std_arr > 0, std_arr, 1.0)
+    valid = debit_mask & (count_arr >= 3) & (std_arr > 0)
+    z_scores = np.where(valid, (amounts - mean_arr) / safe_std, 0.0)
+
+    scores = np.round(z_scores, 2)
+    flags = np.abs(z_scores) >= 2.0
+
+    return [
+        AnomalyItem(
+            date=date,
+            amount=float(amount),
+            category=category,
+            score=float(score),
+            isAnomaly=bool(flag),
         )
-    
-    return results
+        for date, amount, category, score, flag in zip(
+            dates, amounts, raw_categories, scores, flags
+        )
+    ]
 
 
 def forecast(transactions: list[Txn]) -> list[ForecastItem]:
     """
     Forecast next month spending by category using simple methods.
-    
+
     Methods:
     - SMA3: 3-month simple moving average
     - lastValue: Use last month's value if not enough data
     """
-    # Group debit transactions by category and month
-    category_monthly = defaultdict(lambda: defaultdict(float))
-    
-    for txn in transactions:
-        if txn.direction == "DEBIT":
-            try:
-                # Extract YYYY-MM from date
-                month = txn.date[:7]  # "2025-01-15" -> "2025-01"
-                category = txn.category or "Uncategorized"
-                category_monthly[category][month] += txn.amount
-            except (ValueError, IndexError):
-                continue
-    
+    if not transactions:
+        return []
+
+    return forecast_df(_to_frame(transactions))
+
+
+def forecast_df(df: pd.DataFrame) -> list[ForecastItem]:
+    """Vectorized core of forecast(), operating on a pre-built frame."""
+    debits = df.loc[df["direction"].values == "DEBIT", ["date", "category", "amount"]]
+    if debits.empty:
+        return []
+
+    # Month buckets and category normalization, both vectorized
+    debits = debits.assign(
+        month=debits["date"].str[:7],  # "2025-01-15" -> "2025-01"
+        category=debits["category"].fillna("Uncategorized").replace("", "Uncategorized"),
+    )
+
+    # One C-level aggregation instead of the nested defaultdict walk;
+    # months a category has no data for stay NaN so they don't dilute SMA3
+    monthly = debits.pivot_table(
+        index="month", columns="category", values="amount", aggfunc="sum"
+    ).sort_index()
+
     forecasts = []
-    
-    for category, monthly_data in category_monthly.items():
-        # Sort months chronologically
-        sorted_months = sorted(monthly_data.items())
-        
-        if len(sorted_months) == 0:
+
+    # Iterate categories in first-seen order, as the dict version did
+    for category in pd.unique(debits["category"]):
+        amounts = monthly[category].dropna().to_numpy()
+
+        if len(amounts) == 0:
             continue
-        
-        amounts = [amount for _, amount in sorted_months]
-        
-        # Use SMA3 if we have at least 3 months
+
+        # Use SMA3 if we have at least 3 months, else last value
         if len(amounts) >= 3:
-            last_three = amounts[-3:]
-            predicted = statistics.mean(last_three)
+            predicted = amounts[-3:].mean()
             method = "SMA3"
         else:
-            # Use last value
             predicted = amounts[-1]
             method = "lastValue"
-        
+
         forecasts.append(
             ForecastItem(
                 category=category,
-                nextMonthForecast=round(predicted, 2),
+                nextMonthForecast=round(float(predicted), 2),
                 method=method
             )
         )
-    
+
     return forecasts
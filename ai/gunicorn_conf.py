@@ -0,0 +1,18 @@
+"""Gunicorn configuration for the FinSmart AI service.
+
+Runs multiple Uvicorn workers with the app preloaded in the master
+process, so read-only pages (code, loaded data) are shared copy-on-write
+across workers instead of duplicated per process.
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8001')}"
+workers = int(os.getenv("WEB_CONCURRENCY", max(2, multiprocessing.cpu_count() // 2)))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# One BLAS/OpenMP thread per worker; process-level parallelism comes from
+# the worker count, and oversubscription only adds contention
+os.environ.setdefault("OMP_NUM_THREADS", "1")
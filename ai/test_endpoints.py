@@ -1,8 +1,14 @@
-"""Quick manual test for AI service endpoints."""
+"""Quick manual test for AI service endpoints.
 
-import requests
+Uses one pooled httpx.AsyncClient so all endpoint checks share a single
+keep-alive connection and the independent POSTs run concurrently.
+"""
+
+import asyncio
 import json
 
+import httpx
+
 BASE_URL = "http://localhost:8001"
 
 # Sample test data
@@ -87,26 +93,26 @@ test_transactions = [
 ]
 
 
-def test_health():
+async def test_health(client: httpx.AsyncClient):
     """Test health endpoint."""
     print("\n=== Testing /health ===")
-    response = requests.get(f"{BASE_URL}/health")
+    response = await client.get("/health")
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     return response.status_code == 200
 
 
-def test_analyze():
+async def test_analyze(client: httpx.AsyncClient):
     """Test analyze endpoint."""
     print("\n=== Testing /analyze ===")
     payload = {"transactions": test_transactions}
-    response = requests.post(f"{BASE_URL}/analyze", json=payload)
+    response = await client.post("/analyze", json=payload)
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     return response.status_code == 200
 
 
-def test_categorize():
+async def test_categorize(client: httpx.AsyncClient):
     """Test categorize endpoint."""
     print("\n=== Testing /categorize ===")
     # Test with transactions missing categories
@@ -117,65 +123,73 @@ def test_categorize():
         {"date": "2025-01-18", "amount": 100.00, "direction": "DEBIT", "category": None, "description": "Random store"}
     ]
     payload = {"transactions": test_txns}
-    response = requests.post(f"{BASE_URL}/categorize", json=payload)
+    response = await client.post("/categorize", json=payload)
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     return response.status_code == 200
 
 
-def test_anomalies():
+async def test_anomalies(client: httpx.AsyncClient):
     """Test anomalies endpoint."""
     print("\n=== Testing /anomalies ===")
     payload = {"transactions": test_transactions}
-    response = requests.post(f"{BASE_URL}/anomalies", json=payload)
+    response = await client.post("/anomalies", json=payload)
     print(f"Status: {response.status_code}")
     result = response.json()
     print(f"Response: {json.dumps(result, indent=2)}")
-    
+
     # Highlight anomalies
     if response.status_code == 200:
         anomalies = [a for a in result["anomalies"] if a["isAnomaly"]]
         print(f"\n>>> Found {len(anomalies)} anomalies:")
         for a in anomalies:
             print(f"  - {a['date']}: ${a['amount']:.2f} in {a['category']} (z-score: {a['score']})")
-    
+
     return response.status_code == 200
 
 
-def test_forecast():
+async def test_forecast(client: httpx.AsyncClient):
     """Test forecast endpoint."""
     print("\n=== Testing /forecast ===")
     payload = {"transactions": test_transactions}
-    response = requests.post(f"{BASE_URL}/forecast", json=payload)
+    response = await client.post("/forecast", json=payload)
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     return response.status_code == 200
 
 
+async def main():
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        # One keep-alive connection pool; the five checks are independent,
+        # so run them concurrently
+        passed = await asyncio.gather(
+            test_health(client),
+            test_analyze(client),
+            test_categorize(client),
+            test_anomalies(client),
+            test_forecast(client),
+        )
+
+    results = dict(zip(["health", "analyze", "categorize", "anomalies", "forecast"], passed))
+
+    print("\n\n=== Test Summary ===")
+    for endpoint, ok in results.items():
+        status = "✅ PASSED" if ok else "❌ FAILED"
+        print(f"{endpoint:15} {status}")
+
+    all_passed = all(results.values())
+    print(f"\nOverall: {'✅ ALL TESTS PASSED' if all_passed else '❌ SOME TESTS FAILED'}")
+
+
 if __name__ == "__main__":
     print("Starting AI service tests...")
     print(f"Target URL: {BASE_URL}")
     print("\nMake sure the service is running:")
     print("  cd ai")
     print("  uvicorn app.main:app --reload --port 8001")
-    
+
     try:
-        results = {
-            "health": test_health(),
-            "analyze": test_analyze(),
-            "categorize": test_categorize(),
-            "anomalies": test_anomalies(),
-            "forecast": test_forecast()
-        }
-        
-        print("\n\n=== Test Summary ===")
-        for endpoint, passed in results.items():
-            status = "✅ PASSED" if passed else "❌ FAILED"
-            print(f"{endpoint:15} {status}")
-        
-        all_passed = all(results.values())
-        print(f"\nOverall: {'✅ ALL TESTS PASSED' if all_passed else '❌ SOME TESTS FAILED'}")
-        
-    except requests.exceptions.ConnectionError:
+        asyncio.run(main())
+    except httpx.ConnectError:
         print("\n❌ ERROR: Could not connect to service")
         print("Make sure the service is running on port 8001")
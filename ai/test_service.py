@@ -1,5 +1,6 @@
 """Quick test script to verify the refactored AI service works."""
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -24,7 +25,7 @@ def test_analyze_single_transaction():
     req = AnalyzeRequest(
         transactions=[Txn(date="2025-01-01", amount=100.5, category="Food", direction="DEBIT")]
     )
-    result = analyze(req)
+    result = asyncio.run(analyze(req))
     assert result.totalDebit == 100.5
     assert result.biggestCategory == "Food"
     print("✅ Single transaction analysis passed")
@@ -39,7 +40,7 @@ def test_analyze_multiple_transactions():
             Txn(date="2025-01-03", amount=75.25, category="Shopping", direction="DEBIT"),
         ]
     )
-    result = analyze(req)
+    result = asyncio.run(analyze(req))
     assert result.totalDebit == 225.75
     assert result.biggestCategory == "Food"  # Biggest category
     print("✅ Multiple transaction analysis passed")